@@ -5,10 +5,17 @@ Semantic Scholar API を使用して2025年に発表された
 
 import os
 import sys
+import math
 import time
 import json
+import gzip
+import threading
+import orjson
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+from typing import Optional, Dict, Any, Iterator, List
 from datetime import datetime
 
 
@@ -16,6 +23,8 @@ class SemanticScholarFetcher:
     """Semantic Scholar APIから論文データを取得するクラス"""
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1/paper/search/bulk"
+    WRITE_BUFFER_SIZE = 1024 * 1024  # 出力ファイルの書き込みバッファ（1 MiB）
+    GZIP_SIZE_MARGIN = 64 * 1024  # gzipトレーラーと終端ブロック用に分割サイズから差し引く余裕
 
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -26,136 +35,376 @@ class SemanticScholarFetcher:
         """
         self.api_key = api_key or os.getenv("SEMANTIC_SCHOLAR_API_KEY")
         self.session = requests.Session()
+        # 接続先は1ホストのみ。先行取得スレッドと併用しても接続を使い回せるプールを用意し、
+        # リトライは _make_request で行うためアダプター側では行わない
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
         if self.api_key:
             self.session.headers.update({"x-api-key": self.api_key})
 
         # レート制限: APIキーありの場合は1 RPS、なしの場合はより慎重に
-        self.rate_limit_delay = 1.1  # 秒
-        self.last_request_time = 0
+        self.rate_limit_delay = 1.1  # 秒（トークン1個の補充にかかる時間）
+        # 429応答に応じてAIMDで調整する間隔の範囲
+        self.min_rate_limit_delay = self.rate_limit_delay
+        # 上限は基本間隔の4倍に抑え、成功10回で上限から基本間隔まで戻す
+        self.max_rate_limit_delay = 4 * self.min_rate_limit_delay
+        self.rate_limit_recovery_step = (self.max_rate_limit_delay - self.min_rate_limit_delay) / 10
+        # Retry-After などサーバーが指定する待機時間の上限（秒）
+        self.max_server_wait = 300.0
+        # トークンバケット（容量1）の状態
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        # x-ratelimit-* ヘッダーから判断した、次のリクエストを送ってよい時刻
+        self._throttle_until = 0.0
+        # 先行取得スレッドとメインスレッドでレート制限の状態を共有する
+        self._rate_limit_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """セッションを閉じ、保持しているkeep-alive接続を解放する"""
+        self.session.close()
+
+    @staticmethod
+    def _sleep(seconds: float, stop_event: Optional[threading.Event] = None) -> bool:
+        """
+        指定秒数待機する（stop_eventがセットされたら途中で打ち切る）
+
+        Args:
+            seconds: 待機秒数
+            stop_event: 停止要求を通知するイベント
 
-    def _wait_for_rate_limit(self):
-        """レート制限を守るための待機"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        Returns:
+            停止要求により打ち切られた場合はTrue
+        """
+        if stop_event is None:
+            time.sleep(seconds)
+            return False
+        return stop_event.wait(seconds)
+
+    def _wait_for_rate_limit(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """
+        レート制限を守るための待機（容量1のトークンバケット）
+
+        Args:
+            stop_event: 停止要求を通知するイベント
+
+        Returns:
+            停止要求により待機が打ち切られた場合はTrue（トークンは消費しない）
+        """
+        with self._rate_limit_lock:
+            # クォータ枯渇が近い場合はリセットまで待機
+            now = time.monotonic()
+            if now < self._throttle_until:
+                if self._sleep(self._throttle_until - now, stop_event):
+                    return True
+                now = time.monotonic()
+
+            # 前回からの経過時間分トークンを補充（容量1で頭打ち）
+            self._tokens = min(1.0, self._tokens + (now - self._last_refill) / self.rate_limit_delay)
+            self._last_refill = now
+
+            # トークンが足りなければ1個たまるまで待機
+            if self._tokens < 1.0:
+                if self._sleep((1.0 - self._tokens) * self.rate_limit_delay, stop_event):
+                    return True
+                self._tokens = 1.0
+                self._last_refill = time.monotonic()
+
+            self._tokens -= 1.0
+            return False
+
+    def _throttle_from_headers(self, headers):
+        """
+        レート制限ヘッダーを確認し、残りが1割未満ならリセットまで次のリクエストを遅らせる
+
+        Args:
+            headers: レスポンスヘッダー
+        """
+        try:
+            limit = int(headers["x-ratelimit-limit"])
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset = float(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+
+        if limit <= 0 or remaining / limit >= 0.1:
+            return
+
+        # リセット時刻はエポック秒・残り秒数のどちらの形式でも受け付ける
+        # （任意ヘッダーのため、エポックミリ秒など上限を超える値は無視する）
+        wait_time = reset - time.time() if reset > 1e9 else reset
+        if not math.isfinite(wait_time) or wait_time > self.max_server_wait:
+            return
+
+        if wait_time > 0:
+            print(f"残りリクエスト数が少ないため（{remaining}/{limit}）、{wait_time:.1f}秒待機します...")
+            with self._rate_limit_lock:
+                self._throttle_until = max(self._throttle_until, time.monotonic() + wait_time)
+
+    @staticmethod
+    def _update_citation_stats(citation_stats: Dict[str, int], papers: List[Dict[str, Any]]):
+        """
+        1ページ分の引用数を統計に加える（組み込みのsum/min/maxでまとめて計算）
+
+        Args:
+            citation_stats: 更新する引用数統計（count, sum, min, max）
+            papers: 1ページ分の論文リスト
+        """
+        # citationCountの参照は1論文につき1回だけ
+        citation_counts = [
+            citation_count for paper in papers
+            if (citation_count := paper.get("citationCount")) is not None
+        ]
+        if not citation_counts:
+            return
+
+        citation_stats["count"] += len(citation_counts)
+        citation_stats["sum"] += sum(citation_counts)
+        citation_stats["min"] = min(citation_stats["min"], min(citation_counts))
+        citation_stats["max"] = max(citation_stats["max"], max(citation_counts))
+
+    @staticmethod
+    def _release_file_cache(filename: str):
+        """
+        書き終えたファイルをディスクに同期し、ページキャッシュから追い出す
+        （再読み込みしない分割ファイルがメモリを占有し続けないようにする）
+
+        Args:
+            filename: 閉じ終えたファイル名
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        fd = os.open(filename, os.O_RDONLY)
+        try:
+            # ダーティページはDONTNEEDで破棄されないため先に書き出す
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+    def _open_output_file(self, filename: str, compress: bool):
+        """
+        出力ファイルを書き込みバッファ付きのバイナリモードで開く
+
+        Args:
+            filename: ファイル名
+            compress: Trueの場合はgzip（圧縮レベル1）で圧縮しながら書き込む
+
+        Returns:
+            (書き込み用ファイル, ディスクに書き込む下層のファイル)
+        """
+        raw_file = open(filename, "wb", buffering=self.WRITE_BUFFER_SIZE)
+        if not compress:
+            return raw_file, raw_file
+        return gzip.GzipFile(fileobj=raw_file, mode="wb", compresslevel=1), raw_file
+
+    def _close_output_file(self, output_file, raw_file, filename: str) -> int:
+        """
+        出力ファイルを閉じてページキャッシュを解放する
+
+        Args:
+            output_file: 書き込み用ファイル
+            raw_file: 下層のファイル
+            filename: ファイル名
+
+        Returns:
+            ディスク上のファイルサイズ（バイト）
+        """
+        output_file.close()
+        raw_file.close()
+        self._release_file_cache(filename)
+        return os.path.getsize(filename)
 
     def _make_request(
         self,
-        params: Dict[str, Any],
-        max_retries: int = 5
+        url: str,
+        max_retries: int = 5,
+        stop_event: Optional[threading.Event] = None
     ) -> Optional[Dict[str, Any]]:
         """
         APIリクエストを実行（指数バックオフ付き）
 
         Args:
-            params: クエリパラメータ
+            url: クエリ文字列を含むリクエストURL
             max_retries: 最大リトライ回数
+            stop_event: 停止要求を通知するイベント（セットされたらリトライと待機を打ち切る）
 
         Returns:
-            APIレスポンス（JSON）
+            APIレスポンス（JSON）。停止要求で打ち切った場合はNone
         """
         for attempt in range(max_retries):
+            # 呼び出し側が既に処理を止めていれば、これ以上リクエストしない
+            if stop_event is not None and stop_event.is_set():
+                return None
+
             # リトライ時も含めて毎回レート制限を守る（全エンドポイント合算1RPS）
-            self._wait_for_rate_limit()
+            if self._wait_for_rate_limit(stop_event):
+                return None
 
             try:
-                response = self.session.get(self.BASE_URL, params=params, timeout=30)
+                response = self.session.get(url, timeout=30)
 
-                # レート制限エラーの場合は指数バックオフ
+                # レート制限エラーの場合はリクエスト間隔を倍にする（乗算的減少）
                 if response.status_code == 429:
-                    wait_time = (2 ** attempt) * self.rate_limit_delay
+                    self.rate_limit_delay = min(self.max_rate_limit_delay, self.rate_limit_delay * 2)
+
+                    # Retry-Afterで有効な待機時間が指定されていればそれに従う（上限あり）
+                    try:
+                        retry_after = float(response.headers.get("Retry-After"))
+                    except (TypeError, ValueError):
+                        retry_after = math.nan
+                    if math.isfinite(retry_after) and retry_after >= 0:
+                        wait_time = min(retry_after, self.max_server_wait)
+                    else:
+                        # 指定がない・不正な値なら基本間隔からの指数バックオフ
+                        wait_time = (2 ** attempt) * self.min_rate_limit_delay
                     print(f"レート制限に達しました。{wait_time:.1f}秒待機します...")
-                    time.sleep(wait_time)
+                    if self._sleep(wait_time, stop_event):
+                        return None
+
+                    # 待機した時間を再試行までの間隔とし、トークンバケットでは追加で待たない
+                    with self._rate_limit_lock:
+                        self._tokens = 1.0
+                        self._last_refill = time.monotonic()
                     continue
 
                 response.raise_for_status()
-                return response.json()
 
-            except requests.exceptions.RequestException as e:
+                # 残りクォータが少なければ次のリクエストを遅らせる
+                self._throttle_from_headers(response.headers)
+
+                # 成功したら間隔を一定量ずつ戻す（加算的増加）
+                self.rate_limit_delay = max(
+                    self.min_rate_limit_delay, self.rate_limit_delay - self.rate_limit_recovery_step
+                )
+                # orjsonはキー文字列をキャッシュするため、全ページで同じキーのオブジェクトが共有される
+                return orjson.loads(response.content)
+
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
                 print(f"リクエストエラー (試行 {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) * self.rate_limit_delay
-                    time.sleep(wait_time)
+                    wait_time = (2 ** attempt) * self.min_rate_limit_delay
+                    if self._sleep(wait_time, stop_event):
+                        return None
                 else:
                     raise
 
         return None
 
-    def search_papers_streaming(
+    def _iter_pages(
         self,
         query: str,
         year: str,
-        fields: List[str],
-        output_file
-    ) -> tuple[int, int, List[int]]:
+        fields: List[str]
+    ) -> Iterator[tuple[int, List[Dict[str, Any]]]]:
         """
-        論文を検索してJSONL形式で逐次保存
+        論文を検索してページ単位で返すジェネレータ
+        （次のページは呼び出し側が現在のページを書き込んでいる間に先行取得する）
 
         Args:
             query: 検索クエリ
             year: 年フィルタ（例: "2025"）
             fields: 取得するフィールドのリスト
-            output_file: 開かれたファイルハンドル
 
-        Returns:
-            (総検索結果数, 取得件数, 引用数リスト)
+        Yields:
+            (総検索結果数, 1ページ分の論文リスト)
         """
-        params = {
+        # クエリ文字列は一度だけエンコードし、ページごとにはトークンのみ付け足す
+        search_url = f"{self.BASE_URL}?" + urlencode({
             "query": query,
             "year": year,
             "fields": ",".join(fields)
-        }
+        })
 
         total_results = 0
-        fetched_count = 0
-        citations = []
-        token = None
         page = 1
 
-        print(f"検索中: '{query}' (年: {year})")
-        print(f"取得フィールド: {', '.join(fields)}")
-        print("-" * 80)
+        # 呼び出し側が途中で止めた場合（書き込みエラー、Ctrl-C、ジェネレータのclose）に
+        # 先行取得中のリクエストのリトライ完了を待たずに抜けるための停止要求
+        stop_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(self._make_request, search_url, stop_event=stop_event)
 
-        while True:
-            # トークンがある場合はパラメータに追加
-            if token:
-                params["token"] = token
+            while True:
+                print(f"ページ {page} を取得中...", end=" ")
 
-            print(f"ページ {page} を取得中...", end=" ", flush=True)
+                result = future.result()
+                if not result:
+                    return
 
-            result = self._make_request(params)
-            if not result:
-                break
+                # 初回のみ総件数を取得
+                if page == 1:
+                    total_results = result.get("total", 0)
+                    print(f"\n総検索結果数: {total_results:,} 件")
+                    print("-" * 80)
 
-            # 初回のみ総件数を取得
-            if page == 1:
-                total_results = result.get("total", 0)
-                print(f"\n総検索結果数: {total_results:,} 件")
-                print("-" * 80)
+                # 次のページを先行取得し、書き込みとレート制限待機を重ねる
+                token = result.get("token")
+                if token:
+                    future = executor.submit(
+                        self._make_request,
+                        f"{search_url}&{urlencode({'token': token})}",
+                        stop_event=stop_event
+                    )
 
-            # データを逐次書き込み
-            papers = result.get("data", [])
-            for paper in papers:
-                json.dump(paper, output_file, ensure_ascii=False)
-                output_file.write("\n")
-                fetched_count += 1
+                yield total_results, result.get("data", [])
 
-                # 引用数の統計用
-                if paper.get("citationCount") is not None:
-                    citations.append(paper["citationCount"])
+                if not token:
+                    print("\nすべてのページを取得しました。")
+                    return
 
-            print(f"{len(papers)} 件取得（累計: {fetched_count:,} 件）")
+                page += 1
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            # 次のページのトークンを取得
-            token = result.get("token")
-            if not token:
-                print("\nすべてのページを取得しました。")
-                break
+    def search_papers_streaming(
+        self,
+        query: str,
+        year: str,
+        fields: List[str],
+        output_file
+    ) -> tuple[int, int, Dict[str, int]]:
+        """
+        論文を検索してJSONL形式で逐次保存
 
-            page += 1
+        Args:
+            query: 検索クエリ
+            year: 年フィルタ（例: "2025"）
+            fields: 取得するフィールドのリスト
+            output_file: バイナリモードで開かれたファイルハンドル
 
-        return total_results, fetched_count, citations
+        Returns:
+            (総検索結果数, 取得件数, 引用数統計)
+        """
+        total_results = 0
+        fetched_count = 0
+        # 引用数の統計（全件を保持せず逐次集計）
+        citation_stats = {"count": 0, "sum": 0, "min": sys.maxsize, "max": 0}
+
+        print(f"検索中: '{query}' (年: {year})")
+        print(f"取得フィールド: {', '.join(fields)}")
+        print("-" * 80)
+
+        for total_results, papers in self._iter_pages(query, year, fields):
+            # ページ単位でJSON行をまとめて書き込み
+            buf = [orjson.dumps(paper, option=orjson.OPT_APPEND_NEWLINE) for paper in papers]
+
+            # 引用数の統計用（ページ単位でまとめて集計）
+            self._update_citation_stats(citation_stats, papers)
+
+            output_file.write(b"".join(buf))
+            fetched_count += len(buf)
+
+            print(f"{len(papers)} 件取得（累計: {fetched_count:,} 件）")
+
+        return total_results, fetched_count, citation_stats
 
     def search_papers_with_split(
         self,
@@ -163,8 +412,9 @@ class SemanticScholarFetcher:
         year: str,
         fields: List[str],
         base_filename: str,
-        max_size_mb: int = 40
-    ) -> tuple[int, int, List[int], List[str]]:
+        max_size_mb: int = 40,
+        compress: bool = True
+    ) -> tuple[int, int, Dict[str, int], List[str]]:
         """
         論文を検索してJSONL形式で逐次保存（ファイルサイズ制限付き）
 
@@ -173,29 +423,31 @@ class SemanticScholarFetcher:
             year: 年フィルタ（例: "2025"）
             fields: 取得するフィールドのリスト
             base_filename: 出力ファイル名のベース（拡張子なし）
-            max_size_mb: 1ファイルの最大サイズ（MB）
+            max_size_mb: 1ファイルの最大サイズ（MB、圧縮時は圧縮後のサイズ）。
+                圧縮時は書き込み前の行を未圧縮サイズで見積もるため、上限を超えない代わりに
+                1ページ分の未圧縮サイズ程度早めに分割される。1ページの未圧縮サイズ（数MB）より
+                十分大きな値を指定すること
+            compress: gzip圧縮して .jsonl.gz として保存するか
 
         Returns:
-            (総検索結果数, 取得件数, 引用数リスト, 出力ファイルリスト)
+            (総検索結果数, 取得件数, 引用数統計, 出力ファイルリスト)
         """
-        params = {
-            "query": query,
-            "year": year,
-            "fields": ",".join(fields)
-        }
-
         total_results = 0
         fetched_count = 0
-        citations = []
+        # 引用数の統計（全件を保持せず逐次集計）
+        citation_stats = {"count": 0, "sum": 0, "min": sys.maxsize, "max": 0}
         output_files = []
-        token = None
-        page = 1
 
         # 現在のファイル情報
         current_file_index = 1
         current_file = None
+        current_raw_file = None
         current_file_size = 0
+        current_file_count = 0
+        extension = ".jsonl.gz" if compress else ".jsonl"
         max_size_bytes = max_size_mb * 1024 * 1024
+        if compress:
+            max_size_bytes -= self.GZIP_SIZE_MARGIN
 
         print(f"検索中: '{query}' (年: {year})")
         print(f"取得フィールド: {', '.join(fields)}")
@@ -205,80 +457,70 @@ class SemanticScholarFetcher:
         try:
             # 最初のファイルを開く
             if current_file_index == 1:
-                filename = f"{base_filename}.jsonl"
+                filename = f"{base_filename}{extension}"
             else:
-                filename = f"{base_filename}_part{current_file_index}.jsonl"
+                filename = f"{base_filename}_part{current_file_index}{extension}"
 
-            current_file = open(filename, "w", encoding="utf-8")
+            current_file, current_raw_file = self._open_output_file(filename, compress)
             output_files.append(filename)
             print(f"ファイル作成: {filename}")
 
-            while True:
-                # トークンがある場合はパラメータに追加
-                if token:
-                    params["token"] = token
-
-                print(f"ページ {page} を取得中...", end=" ", flush=True)
-
-                result = self._make_request(params)
-                if not result:
-                    break
+            for total_results, papers in self._iter_pages(query, year, fields):
+                # ページ単位でJSON行をまとめて作成
+                buf = [orjson.dumps(paper, option=orjson.OPT_APPEND_NEWLINE) for paper in papers]
 
-                # 初回のみ総件数を取得
-                if page == 1:
-                    total_results = result.get("total", 0)
-                    print(f"\n総検索結果数: {total_results:,} 件")
-                    print("-" * 80)
+                # 引用数の統計用（ページ単位でまとめて集計）
+                self._update_citation_stats(citation_stats, papers)
 
-                # データを逐次書き込み
-                papers = result.get("data", [])
-                for paper in papers:
-                    # JSON行を作成
-                    json_line = json.dumps(paper, ensure_ascii=False) + "\n"
-                    line_size = len(json_line.encode('utf-8'))
+                # ファイルサイズ上限の境界でbufを分割しながら書き込み
+                # （圧縮時はページごとに圧縮器をフラッシュしてディスク上のサイズを確定させ、
+                #   これから書く行は未圧縮サイズで多めに見積もる）
+                if compress:
+                    current_file.flush()
+                current_file_size = current_raw_file.tell()
+                start = 0
+                chunk_size = 0
+                for i, json_line in enumerate(buf):
+                    line_size = len(json_line)
 
                     # ファイルサイズをチェック
-                    if current_file_size + line_size > max_size_bytes and fetched_count > 0:
-                        # 現在のファイルを閉じる
-                        current_file.close()
-                        file_size_mb = current_file_size / (1024 * 1024)
+                    if current_file_size + chunk_size + line_size > max_size_bytes and (current_file_count > 0 or i > start):
+                        # 境界までを書き込んで現在のファイルを閉じる
+                        current_file.write(b"".join(buf[start:i]))
+                        file_size = self._close_output_file(current_file, current_raw_file, output_files[-1])
+                        current_file = None
+                        file_size_mb = file_size / (1024 * 1024)
                         print(f"\nファイル完成: {output_files[-1]} ({file_size_mb:.1f} MB)")
 
                         # 新しいファイルを開く
                         current_file_index += 1
-                        filename = f"{base_filename}_part{current_file_index}.jsonl"
-                        current_file = open(filename, "w", encoding="utf-8")
+                        filename = f"{base_filename}_part{current_file_index}{extension}"
+                        current_file, current_raw_file = self._open_output_file(filename, compress)
                         output_files.append(filename)
-                        current_file_size = 0
+                        current_file_size = current_raw_file.tell()
+                        current_file_count = 0
                         print(f"ファイル作成: {filename}")
 
-                    # 書き込み
-                    current_file.write(json_line)
-                    current_file_size += line_size
-                    fetched_count += 1
+                        start = i
+                        chunk_size = 0
 
-                    # 引用数の統計用
-                    if paper.get("citationCount") is not None:
-                        citations.append(paper["citationCount"])
+                    chunk_size += line_size
 
-                print(f"{len(papers)} 件取得（累計: {fetched_count:,} 件）")
-
-                # 次のページのトークンを取得
-                token = result.get("token")
-                if not token:
-                    print("\nすべてのページを取得しました。")
-                    break
+                # 残りを書き込み
+                current_file.write(b"".join(buf[start:]))
+                current_file_count += len(buf) - start
+                fetched_count += len(buf)
 
-                page += 1
+                print(f"{len(papers)} 件取得（累計: {fetched_count:,} 件）")
 
         finally:
             # 最後のファイルを閉じる
             if current_file:
-                current_file.close()
-                file_size_mb = current_file_size / (1024 * 1024)
+                file_size = self._close_output_file(current_file, current_raw_file, output_files[-1])
+                file_size_mb = file_size / (1024 * 1024)
                 print(f"ファイル完成: {output_files[-1]} ({file_size_mb:.1f} MB)")
 
-        return total_results, fetched_count, citations, output_files
+        return total_results, fetched_count, citation_stats, output_files
 
 
 def main():
@@ -338,14 +580,13 @@ def main():
     print(f"検索クエリ: {query}")
     print(f"{'=' * 80}\n")
 
-    # フェッチャーを初期化
-    fetcher = SemanticScholarFetcher(api_key)
-
     try:
-        # 論文を検索・分割保存（100MB制限）
-        total, fetched_count, citations, output_files = fetcher.search_papers_with_split(
-            query, year, fields, base_filename, max_size_mb=100
-        )
+        # フェッチャーを初期化（全ページで同じTLS接続を使い回す）
+        with SemanticScholarFetcher(api_key) as fetcher:
+            # 論文を検索・分割保存（100MB制限）
+            total, fetched_count, citation_stats, output_files = fetcher.search_papers_with_split(
+                query, year, fields, base_filename, max_size_mb=100
+            )
 
         # 統計情報を表示
         if fetched_count > 0:
@@ -365,11 +606,11 @@ def main():
             print(f"取得件数: {fetched_count:,} 件")
 
             # 引用数の統計
-            if citations:
+            if citation_stats["count"]:
                 print(f"\n引用数統計:")
-                print(f"  - 最大: {max(citations):,} 回")
-                print(f"  - 最小: {min(citations):,} 回")
-                print(f"  - 平均: {sum(citations) / len(citations):.1f} 回")
+                print(f"  - 最大: {citation_stats['max']:,} 回")
+                print(f"  - 最小: {citation_stats['min']:,} 回")
+                print(f"  - 平均: {citation_stats['sum'] / citation_stats['count']:.1f} 回")
 
             # manifest.jsonを更新
             update_manifest(dataset_type, output_files[0], timestamp)